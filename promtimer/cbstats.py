@@ -22,6 +22,9 @@ import zipfile
 import io
 import time
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from os import path
 from urllib.parse import urlparse, urlunparse
 from http.client import HTTPException
@@ -31,6 +34,20 @@ import util
 COUCHBASE_LOG = 'couchbase.log'
 DIAG_LOG = 'diag.log'
 STATS_SNAPSHOT_DIR_NAME = 'stats_snapshot'
+_STATS_SNAPSHOT_SUBPATH = '/' + STATS_SNAPSHOT_DIR_NAME + '/'
+_NOSCRAPE_YML = path.join(util.get_root_dir(), 'noscrape.yml')
+# Upper bound on the number of threads used to process cbcollects concurrently
+MAX_WORKERS = 8
+
+_CBCOLLECT_NAME_RE = re.compile(r'cbcollect_info_ns_(\d+)@(.*)_(\d+)-(\d+)')
+
+# Section markers and patterns used when parsing couchbase.log
+_NS_CONFIG_MARKER = b'Couchbase config'
+_CHRONICLE_CONFIG_MARKER = b'Chronicle config'
+_CHRONICLE_DUMP_MARKER = b'Chronicle dump'
+_CHRONICLE_START_RE = re.compile(rb'(^\s*.{bucket_names,{\[)([^]]*)(])?')
+_CHRONICLE_END_RE = re.compile(rb'^([^]]*)].*')
+_BUCKET_NAME_RE = re.compile(rb'"([^"]+)"')
 
 
 class Source:
@@ -121,12 +138,15 @@ class Source:
 
     @staticmethod
     def maybe_start_stats_servers(stats_sources, log_dir):
-        nodes = []
-        for stats_source in stats_sources:
-            node = stats_source.maybe_start(log_dir)
-            if node is not None:
-                nodes.append(node)
-        return nodes
+        if any(isinstance(s, CBCollect) for s in stats_sources):
+            # Probe the Prometheus binary once up front so that the concurrent starts
+            # below all get the cached result rather than each running the probe
+            CBCollect.prometheus_has_no_lock_file_option()
+        # Each source starts its server independently, so start them concurrently
+        workers = min(MAX_WORKERS, max(1, len(stats_sources)))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            nodes = ex.map(lambda s: s.maybe_start(log_dir), stats_sources)
+            return [node for node in nodes if node is not None]
 
 
 class CBCollect(Source):
@@ -134,11 +154,20 @@ class CBCollect(Source):
     Represents a source of stats data that is a Prometheus instance running against
     the stats snapshot in a cbcollect.
     """
+
+    # Maps each zip file already handled by get_cbcollect_dirs to a 2-tuple of its
+    # modification time when handled and the name of the cbcollect directory that
+    # was extracted from it
+    _extracted_zips = {}
+
+    NO_LOCK_FILE_OPTION = '--storage.tsdb.no-lockfile'
+
     def __init__(self, cbcollect_dir, short_name, prometheus_port, zip_file=None):
         super(CBCollect, self).__init__(prometheus_port)
         self._short_name = short_name
         self._cbcollect_dir = cbcollect_dir
         self._config = None
+        self._times = None
         self._zipfile = zip_file
 
     def short_name(self):
@@ -156,27 +185,35 @@ class CBCollect(Source):
         """
         log_path = path.join(log_dir, 'prom-{}.log'.format(self._short_name))
         listen_addr = '0.0.0.0:{}'.format(self.port())
+        snapshot_dir = path.join(self._cbcollect_dir, STATS_SNAPSHOT_DIR_NAME)
         args = [Source.PROMETHEUS_BIN,
-                '--config.file', path.join(util.get_root_dir(), 'noscrape.yml'),
-                '--storage.tsdb.path', path.join(self._cbcollect_dir, 'stats_snapshot'),
+                '--config.file', _NOSCRAPE_YML,
+                '--storage.tsdb.path', snapshot_dir,
                 '--storage.tsdb.retention.time', '10y',
                 '--query.lookback-delta', '600s',
                 '--web.listen-address', listen_addr]
-        no_lock_file_option = '--storage.tsdb.no-lockfile'
-        if util.search_command_output([Source.PROMETHEUS_BIN, '-h'], no_lock_file_option):
+        if CBCollect.prometheus_has_no_lock_file_option():
             # Package manager installed Prometheus on Ubuntu 20+ is patched to not
             # include the no-lockfile option and instead inverts the semantics with
             # a use-lockfile option. So we omit it if not present in the help.
             # See: https://github.com/couchbaselabs/promtimer/issues/42.
-            args.append(no_lock_file_option)
+            args.append(CBCollect.NO_LOCK_FILE_OPTION)
         name = 'prometheus on {}'.format(listen_addr)
         logging.info('starting {} against {}; logging to {}'
-                     .format(name,
-                             path.join(self._cbcollect_dir, 'stats_snapshot'),
-                             log_path))
+                     .format(name, snapshot_dir, log_path))
         logging.debug('starting {}; full args: {}'.format(name, args))
         return util.Process.start(name, args, log_path)
 
+    @staticmethod
+    def prometheus_has_no_lock_file_option():
+        """
+        Returns whether the Prometheus binary supports the no-lockfile option. The
+        result of the check is cached by util.search_command_output.
+        :rtype: bool
+        """
+        return util.search_command_output([Source.PROMETHEUS_BIN, '-h'],
+                                          CBCollect.NO_LOCK_FILE_OPTION) is not None
+
     def get_buckets(self):
         """
         Returns the list of buckets associated with this stats Source
@@ -192,7 +229,9 @@ class CBCollect(Source):
         times associated with this stats Source
         :return: 2-tuple (min time, max time)
         """
-        return get_prometheus_times(self._cbcollect_dir)
+        if self._times is None:
+            self._times = get_prometheus_times(self._cbcollect_dir)
+        return self._times
 
     @staticmethod
     def make_snapshot_dir_path(candidate_cbcollect_dir):
@@ -226,29 +265,32 @@ class CBCollect(Source):
         return CBCollect.make_snapshot_dir_path(candidate_cbcollect_dir).exists() or \
                CBCollect.make_snapshot_dir_path(candidate_cbcollect_dir  / '.').exists()
 
-    @staticmethod
-    def is_cbcollect_dir(candidate_path):
-        """
-        Returns a guess as to whether candidate_path represents a
-        cbcollect directory by checking whether the 'stats_snapshot' directory exists
-        inside it.
-        :type candidate_path: pathlib.Path
-        """
-        return candidate_path.is_dir() and CBCollect.snapshot_dir_exists(candidate_path)
-
     @staticmethod
     def find_cbcollect_dirs():
-        cbcollects = sorted(glob.glob('cbcollect_info*'))
-        return [f for f in cbcollects if CBCollect.is_cbcollect_dir(pathlib.Path(f))]
+        # DirEntry.is_dir() can typically answer from the directory listing itself,
+        # saving a stat call per entry
+        with os.scandir('.') as entries:
+            return sorted(e.name for e in entries
+                          if e.name.startswith('cbcollect_info') and e.is_dir() and
+                          path.isdir(path.join(e.name, STATS_SNAPSHOT_DIR_NAME)))
 
     @staticmethod
     def get_cbcollect_dirs():
-        zips = sorted(glob.glob('*.zip'))
+        with os.scandir('.') as entries:
+            # Skip hidden files, as glob did, e.g. macOS '._*.zip' AppleDouble files
+            zips = sorted(e.name for e in entries
+                          if not e.name.startswith('.') and e.name.endswith('.zip') and
+                          e.is_file())
         dirs = {}
+        # Zips are extracted serially: different zips may contain the same cbcollect
+        # directory and must not be extracted into it at the same time
         for z in zips:
-            with zipfile.ZipFile(z) as zip_file:
-                dir = CBCollect.maybe_extract_from_zipfile(zip_file)
-                dirs[dir] = z
+            # A zip only needs to be reopened if it has changed since it was handled
+            mtime = path.getmtime(z)
+            if CBCollect._extracted_zips.get(z, (None,))[0] != mtime:
+                root_dir = CBCollect.maybe_extract_from_zip(z)
+                CBCollect._extracted_zips[z] = (mtime, root_dir)
+            dirs[CBCollect._extracted_zips[z][1]] = z
         cbcollect_dirs = CBCollect.find_cbcollect_dirs()
         result = []
         for cbcollect_dir in cbcollect_dirs:
@@ -263,7 +305,17 @@ class CBCollect(Source):
         :type filename: string
         :rtype: bool
         """
-        return filename.find('/{}/'.format(STATS_SNAPSHOT_DIR_NAME)) >= 0
+        return _STATS_SNAPSHOT_SUBPATH in filename
+
+    @staticmethod
+    def maybe_extract_from_zip(zip_filename):
+        """
+        Opens the named zip file and extracts files from it as described in
+        maybe_extract_from_zipfile.
+        :return: the name of the cbcollect directory into which files will be extracted
+        """
+        with zipfile.ZipFile(zip_filename) as zip_file:
+            return CBCollect.maybe_extract_from_zipfile(zip_file)
 
     @staticmethod
     def maybe_extract_from_zipfile(zip_file):
@@ -275,42 +327,48 @@ class CBCollect(Source):
         * couchbase.log: extracted if not present
         :return: the name of the cbcollect directory into which files will be extracted
         """
-        root = zipfile.Path(zip_file)
+        # Index the archive's entries by top-level directory once, rather than
+        # walking the whole archive for every cbcollect directory found in it
+        by_root = defaultdict(list)
+        for item in zip_file.infolist():
+            by_root[item.filename.split('/', 1)[0]].append(item)
         root_dir = None
-        for p in root.iterdir():
-            if CBCollect.is_cbcollect_dir(p):
-                snapshot_exists = CBCollect.snapshot_dir_exists(pathlib.Path(p.name))
-                logging.debug("{}/stats_snapshot exists: {}".format(p.name,
-                                                                    snapshot_exists))
-                root_dir = p.name
-                extracting = False
-                for item in zip_file.infolist():
-                    item_path = path.join(*item.filename.split('/'))
-                    should_extract = False
-                    if CBCollect.is_stats_snapshot_file(item.filename):
-                        should_extract = not snapshot_exists
-                    elif item.filename.endswith(COUCHBASE_LOG):
-                        should_extract = not path.exists(item_path)
-                    if should_extract:
-                        logging.debug("zipfile item:{}, exists:{}".format(
-                            item_path, path.exists(item_path)))
-                        if not extracting:
-                            extracting = True
-                            logging.info('extracting stats, couchbase.log from cbcollect'
-                                         ' zip:{}'
-                                         .format(zip_file.filename))
-                        zip_file.extract(item)
+        to_extract = []
+        for name, items in by_root.items():
+            snapshot_prefix = '{}/{}/'.format(name, STATS_SNAPSHOT_DIR_NAME)
+            if not any(item.filename.startswith(snapshot_prefix) for item in items):
+                continue
+            snapshot_exists = CBCollect.snapshot_dir_exists(pathlib.Path(name))
+            logging.debug("{}/stats_snapshot exists: {}".format(name, snapshot_exists))
+            root_dir = name
+            for item in items:
+                item_path = path.join(*item.filename.split('/'))
+                should_extract = False
+                if CBCollect.is_stats_snapshot_file(item.filename):
+                    should_extract = not snapshot_exists
+                elif item.filename.endswith(COUCHBASE_LOG):
+                    should_extract = not path.exists(item_path)
+                if should_extract:
+                    logging.debug("zipfile item:{}, exists:{}".format(
+                        item_path, path.exists(item_path)))
+                    to_extract.append(item)
+        if to_extract:
+            logging.info('extracting stats, couchbase.log from cbcollect zip:{}'
+                         .format(zip_file.filename))
+            zip_file.extractall(members=to_extract)
         return root_dir
 
     @staticmethod
-    def try_get_data_source_names(cbcollect_dirs, pattern, name_format):
-        data_sources = []
-        for cbcollect in cbcollect_dirs:
-            m = re.match(pattern, cbcollect)
-            name = cbcollect
-            if m:
-                name = name_format.format(*m.groups())
-            data_sources.append(name)
+    def try_get_data_source_names(matches, name_format):
+        """
+        :param matches: list of (match, cbcollect directory name) pairs, where match is
+                        the result of matching the directory name against
+                        _CBCOLLECT_NAME_RE (or None)
+        :param name_format: the format to apply to the groups of each match
+        :return: the list of data source names, or None if they aren't unique
+        """
+        data_sources = [name_format.format(*m.groups()) if m else cbcollect
+                        for m, cbcollect in matches]
         if len(set(data_sources)) == len(data_sources):
             return data_sources
         return None
@@ -328,10 +386,11 @@ class CBCollect(Source):
         :rtype: list of names of data sources; if cbcollect_dirs contains no duplicates the
                 returned list is guaranteed to also contain no duplicates
         """
-        regex = re.compile(r'cbcollect_info_ns_(\d+)@(.*)_(\d+)-(\d+)')
+        matches = [(_CBCOLLECT_NAME_RE.match(d) if 'cbcollect_info' in d else None, d)
+                   for d in cbcollect_dirs]
         formats = ['{1}', 'ns_{0}@{1}', '{1}-{2}-{3}', 'ns_{0}-{1}-{2}-{3}']
         for fmt in formats:
-            result = CBCollect.try_get_data_source_names(cbcollect_dirs, regex, fmt)
+            result = CBCollect.try_get_data_source_names(matches, fmt)
             if result:
                 return result
         return cbcollect_dirs
@@ -363,8 +422,15 @@ class CBCollect(Source):
 
     @staticmethod
     def compute_min_and_max_times(sources):
-        times = [s.get_min_and_max_times() for s in sources]
-        return min([t[0] for t in times]), max([t[1] for t in times])
+        min_time = float('inf')
+        max_time = float('-inf')
+        # Reading the times is I/O bound and independent for each source
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, max(1, len(sources)))) as ex:
+            times = list(ex.map(lambda s: s.get_min_and_max_times(), sources))
+        for source_min, source_max in times:
+            min_time = min(min_time, source_min)
+            max_time = max(max_time, source_max)
+        return min_time, max_time
 
 
 class ServerNode(Source):
@@ -422,11 +488,7 @@ class ServerNode(Source):
                                         username=self._user,
                                         password=self._password,
                                         secure=self._secure)
-        bucket_list = json.loads(response.read())
-        result = []
-        for bucket in bucket_list:
-            result.append(bucket['name'])
-        return result
+        return [bucket['name'] for bucket in json.load(response)]
 
     def get_min_and_max_times(self):
         """
@@ -552,132 +614,175 @@ class ServerNode(Source):
             return []
 
 
-def parse_couchbase_ns_config(cbcollect_dir):
+def _iter_lines(data, start):
+    """
+    Yields the lines of data, beginning with the line that contains offset start.
+    Nothing is yielded if start is negative.
+    """
+    if start < 0:
+        return
+    start = data.rfind(b'\n', 0, start) + 1
+    while start < len(data):
+        end = data.find(b'\n', start)
+        if end < 0:
+            end = len(data)
+        yield data[start:end]
+        start = end + 1
+
+
+def parse_couchbase_ns_config(data, start):
     logging.debug('parsing couchbase.log (Couchbase config)')
+    config_line = _NS_CONFIG_MARKER
     in_config = False
     in_buckets = False
     buckets = []
     section_divider_count = 0
-    with open(path.join(cbcollect_dir, 'couchbase.log'), "r") as file:
-        for full_line in file:
-            line = full_line.rstrip()
-            config_line = 'Couchbase config'
-            if not in_config and line.rstrip() == config_line:
-                in_config = True
-            elif in_config:
-                if line.strip().startswith('=================='):
-                    section_divider_count += 1
-                    if section_divider_count == 2:
-                        break
-                if not in_buckets and line == ' {buckets,':
-                    in_buckets = True
-                elif in_buckets:
-                    if re.match(r'^ {.*,$', line):
-                        break
-                    else:
-                        m = re.match(r'^    [ \[]{\"(.*)\",$', line)
-                        if m:
-                            bucket = m.groups()[0]
-                            logging.debug('found bucket:{}'.format(bucket))
-                            buckets.append(bucket)
-    return {'buckets': sorted(buckets)}
-
-
-def parse_couchbase_chronicle_older_version(cbcollect_dir):
+    for full_line in _iter_lines(data, start):
+        line = full_line.rstrip()
+        if not in_config and line == config_line:
+            in_config = True
+        elif in_config:
+            if line.startswith(b'=================='):
+                section_divider_count += 1
+                if section_divider_count == 2:
+                    break
+            if not in_buckets and line == b' {buckets,':
+                in_buckets = True
+            elif in_buckets:
+                # Plain string tests are equivalent to, and much cheaper than, the
+                # patterns '^ {.*,$' and '^    [ \[]{"(.*)",$' respectively
+                if line.startswith(b' {') and line.endswith(b','):
+                    break
+                elif len(line) >= 9 and line.startswith(b'    ') and \
+                        line[4:5] in b' [' and line.startswith(b'{"', 5) and \
+                        line.endswith(b'",'):
+                    bucket = line[7:-2].decode('utf-8')
+                    logging.debug('found bucket:{}'.format(bucket))
+                    buckets.append(bucket)
+    # The same bucket name can appear more than once in the config
+    return {'buckets': sorted(dict.fromkeys(buckets))}
+
+
+def parse_couchbase_chronicle_older_version(data, start):
     logging.debug('parsing couchbase.log (Chronicle config)')
+    config_line = _CHRONICLE_CONFIG_MARKER
     in_config = False
     in_buckets = False
-    bucket_list = ''
-    with open(path.join(cbcollect_dir, 'couchbase.log'), 'r') as file:
-        for full_line in file:
-            line = full_line.rstrip()
-            if not in_config and line == 'Chronicle config':
-                in_config = True
-            elif in_config:
-                # Names of bucket can be on a single or multiple lines
-                end_of_list = False
-                possible_buckets = ''
-                if not in_buckets:
-                    if line.startswith(' {bucket_names,'):
-                        in_buckets = True
-                        possible_buckets = line.replace(' {bucket_names,[', '')
-                elif in_buckets:
-                    possible_buckets = line
-
-                if possible_buckets != '':
-                    if possible_buckets.endswith(']},'):
-                        possible_buckets = possible_buckets[:-3]
-                        end_of_list = True
-
-                    bucket_list += possible_buckets
-
-                    if end_of_list:
-                        break
+    bucket_list = b''
+    for full_line in _iter_lines(data, start):
+        line = full_line.rstrip()
+        if not in_config and line == config_line:
+            in_config = True
+        elif in_config:
+            # Names of bucket can be on a single or multiple lines
+            end_of_list = False
+            possible_buckets = b''
+            if not in_buckets:
+                if line.startswith(b' {bucket_names,'):
+                    in_buckets = True
+                    possible_buckets = line.replace(b' {bucket_names,[', b'')
+            elif in_buckets:
+                possible_buckets = line
 
-    buckets = []
-    if bucket_list != '':
-        for b in bucket_list.replace(' ', '').replace('"', '').split(','):
-            buckets.append(b)
+            if possible_buckets != b'':
+                if possible_buckets.endswith(b']},'):
+                    possible_buckets = possible_buckets[:-3]
+                    end_of_list = True
+
+                bucket_list += possible_buckets
+
+                if end_of_list:
+                    break
 
-    return {'buckets': sorted(buckets)}
+    buckets = [b.decode('utf-8') for b in _BUCKET_NAME_RE.findall(bucket_list)]
+    buckets.sort()
+    return {'buckets': buckets}
 
 
-def parse_couchbase_chronicle(cbcollect_dir):
+def parse_couchbase_chronicle(data, start):
     logging.debug('parsing couchbase.log (Chronicle config)')
-    bucket_list = ''
-    with open(path.join(cbcollect_dir, 'couchbase.log'), 'r') as file:
-        parsing_config = False
-        parsing_bucket_names = False
-        for full_line in file:
-            line = full_line.rstrip()
-            if not parsing_config and line == 'Chronicle dump':
-                parsing_config = True
-            elif parsing_config:
-                # Names of bucket can be on a single or multiple lines
-                if not parsing_bucket_names:
-                    # E.g. bucket_names may be formatted in the following ways:
-                    #     [{bucket_names,{["bucket-1"],{<<"...,
-                    #      {bucket_names,{["bucket-1"],{<<"...,
-                    #      {bucket_names,{["bucket-1",
-                    #                      "bucket-2"],{<<"...,
-                    m = re.match(r'(^\s*.{bucket_names,{\[)([^]]*)(])?', line)
-                    if m:
-                        parsing_bucket_names = True
-                        bucket_list = m.group(2)
-                        if m.group(3):
-                            # have all the buckets, no need to continue parsing
-                            break
-                else:
-                    m = re.match(r'^([^]]*)].*', line)
-                    if m:
-                        bucket_list += m.group(1)
+    config_line = _CHRONICLE_DUMP_MARKER
+    bucket_list = b''
+    parsing_config = False
+    parsing_bucket_names = False
+    for full_line in _iter_lines(data, start):
+        line = full_line.rstrip()
+        if not parsing_config and line == config_line:
+            parsing_config = True
+        elif parsing_config:
+            # Names of bucket can be on a single or multiple lines
+            if not parsing_bucket_names:
+                # E.g. bucket_names may be formatted in the following ways:
+                #     [{bucket_names,{["bucket-1"],{<<"...,
+                #      {bucket_names,{["bucket-1"],{<<"...,
+                #      {bucket_names,{["bucket-1",
+                #                      "bucket-2"],{<<"...,
+                m = None
+                if b'bucket_names' in line:
+                    m = _CHRONICLE_START_RE.match(line)
+                if m:
+                    parsing_bucket_names = True
+                    bucket_list = m.group(2)
+                    if m.group(3):
+                        # have all the buckets, no need to continue parsing
                         break
-                    else:
-                        bucket_list += line
-    buckets = bucket_list.replace(' ', '').replace('"', '').split(',')
+            else:
+                m = None
+                if b']' in line:
+                    m = _CHRONICLE_END_RE.match(line)
+                if m:
+                    bucket_list += m.group(1)
+                    break
+                else:
+                    bucket_list += line
+    buckets = [b.decode('utf-8') for b in _BUCKET_NAME_RE.findall(bucket_list)]
     logging.debug('found buckets:{}'.format(buckets))
-    return {'buckets': sorted(buckets)}
+    buckets.sort()
+    return {'buckets': buckets}
 
 
 def parse_couchbase_log(cbcollect_dir):
-    config = parse_couchbase_chronicle(cbcollect_dir)
-    if config['buckets'] == []:
-        config = parse_couchbase_chronicle_older_version(cbcollect_dir)
-        if config['buckets'] == []:
-            config = parse_couchbase_ns_config(cbcollect_dir)
-    return config
+    # The parse result is cached, so hand each caller its own copy
+    return {'buckets': list(_parse_couchbase_log_buckets(cbcollect_dir))}
 
 
+@lru_cache(maxsize=64)
+def _parse_couchbase_log_buckets(cbcollect_dir):
+    """
+    :return: tuple of the names of the buckets found in the cbcollect's couchbase.log
+    """
+    # Read the log once and let each parser skip ahead to its own section. The log
+    # is read as bytes to avoid decoding it; only bucket names are decoded
+    with open(path.join(cbcollect_dir, COUCHBASE_LOG), 'rb') as file:
+        data = file.read()
+    # Probe for each section marker once and only run the parsers whose section is
+    # present, preferring the newest format
+    parsers = [(_CHRONICLE_DUMP_MARKER, parse_couchbase_chronicle),
+               (_CHRONICLE_CONFIG_MARKER, parse_couchbase_chronicle_older_version),
+               (_NS_CONFIG_MARKER, parse_couchbase_ns_config)]
+    for marker, parser in parsers:
+        start = data.find(marker)
+        if start >= 0:
+            config = parser(data, start)
+            if config['buckets']:
+                return tuple(config['buckets'])
+    return ()
+
+
+@lru_cache(maxsize=64)
 def get_prometheus_times(cbcollect_dir):
-    min_times = []
-    max_times = []
+    min_time = float('inf')
+    max_time = float('-inf')
     meta_files = glob.glob(path.join(cbcollect_dir, 'stats_snapshot', '*', 'meta.json'))
+    if not meta_files:
+        raise ValueError('no Prometheus blocks (meta.json files) found in {}'.format(
+                         path.join(cbcollect_dir, STATS_SNAPSHOT_DIR_NAME)))
     for meta_file in meta_files:
         with open(meta_file, 'r') as file:
-            meta = json.loads(file.read())
-            min_times.append(meta['minTime'] / 1000.0)
-            max_times.append(meta['maxTime'] / 1000.0)
-    return min(min_times), max(max_times)
+            meta = json.load(file)
+        min_time = min(min_time, meta['minTime'] / 1000.0)
+        max_time = max(max_time, meta['maxTime'] / 1000.0)
+    return min_time, max_time
 
 
 def parse_user_log(stream):